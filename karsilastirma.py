@@ -9,6 +9,17 @@ import os
 import tempfile
 import subprocess
 import platform
+import threading
+import queue
+import argparse
+import json
+import hmac
+import hashlib
+import secrets
+import time
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # --- REPORTLAB IMPORTLARI ---
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
@@ -20,6 +31,14 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase import pdfmetrics
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
+# --- OPENPYXL (İSTEĞE BAĞLI, XLSX DIŞA AKTARIM) ---
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:
+    Workbook = None
+    ILLEGAL_CHARACTERS_RE = None
+
 # --- PANDAS AYARLARI ---
 pd.set_option('future.no_silent_downcasting', True)
 
@@ -56,6 +75,23 @@ BASE_COLUMNS = ["Birim Adı", "Dosya No", "Dosya Durumu", "Dosya Türü"]
 MERGE_FIX_COLUMNS = ["Birim Adı", "Dosya Durumu", "Dosya Türü", "Dosya No", "Sıfatı", "Vekilleri"]
 VALID_DOSYA_TURU = ["Soruşturma Dosyası", "Ceza Dava Dosyası", "CBS İhbar Dosyası"]
 
+# Dosyaya aktarımda bir seferde yazılan satır sayısı ve panoya kopyalanabilecek en fazla satır
+EXPORT_CHUNK_ROWS = 5000
+CLIPBOARD_MAX_ROWS = 2000
+# Excel'in bir sayfada açabileceği en fazla satır (başlık dahil)
+XLSX_MAX_ROWS = 1048576
+
+# Servis modu varsayılanları
+SERVICE_DEFAULT_PORT = 8765
+SERVICE_MEMORY_CAP_MB = 512
+SERVICE_IDLE_SECONDS = 1800
+SERVICE_SWEEP_SECONDS = 60
+SERVICE_OUTPUT_DIR = "servis_cikti"
+SERVICE_TOKEN_HEADER = "X-Servis-Token"
+SERVICE_TOKEN_ENV = "KARSILASTIRMA_SERVIS_ANAHTARI"
+SERVICE_TOKEN_FILE = ".servis_anahtari"
+SERVICE_EXPORT_EXTENSIONS = (".pdf", ".xlsx", ".csv", ".tsv", ".txt")
+
 REPLACEMENTS = {
     "Birim Adı": {"Cumhuriyet Başsavcılığı": "CBS"},
     "Dosya Türü": {"CBS Sorusturma Dosyası": "Soruşturma Dosyası"}
@@ -64,12 +100,13 @@ REPLACEMENTS = {
 # --- GÖRSEL PDF EDİTÖRÜ VE ÖNİZLEME PENCERESİ ---
 
 class PDFLayoutEditor:
-    def __init__(self, parent, dataframe, callback_save):
+    def __init__(self, parent, dataframe, callback_save, column_stats=None):
         self.top = tk.Toplevel(parent)
         self.top.title("PDF Düzenleme ve Önizleme")
         self.top.geometry("1100x700")
         self.df = dataframe
         self.callback_save = callback_save 
+        self.column_stats = column_stats if column_stats is not None else compute_column_stats(dataframe)
         
         self.orientation_var = tk.StringVar(value="Landscape")
         self.margin_var = tk.DoubleVar(value=1.0)
@@ -126,10 +163,7 @@ class PDFLayoutEditor:
     def calculate_initial_weights(self):
         self.sliders = {}
         for col in self.df.columns:
-            max_len = len(str(col))
-            data_len = self.df[col].astype(str).map(len).head(50).max()
-            if pd.isna(data_len): data_len = 0
-            weight = max(max_len, data_len, 5)
+            weight = initial_column_weight(col, self.column_stats[col])
             self.col_weights[col] = tk.DoubleVar(value=weight)
             f = ttk.Frame(self.sliders_frame)
             f.pack(fill=tk.X, pady=2)
@@ -186,66 +220,9 @@ class PDFLayoutEditor:
                 self.canvas.create_text(current_x + col_px/2, draw_y + 15, text=col[:10], font=("Arial", 7), angle=90)
             current_x += col_px
 
-    def get_column_widths_cm(self, page_width_cm):
-        total_weight = sum(v.get() for v in self.col_weights.values())
-        if total_weight == 0: total_weight = 1
-        widths = []
-        for col in self.df.columns:
-            w = (self.col_weights[col].get() / total_weight) * page_width_cm
-            widths.append(w * cm)
-        return widths
-
     def create_pdf_data(self, output_path):
-        margin = self.margin_var.get()
-        orientation = self.orientation_var.get()
-        page_size = landscape(A4) if orientation == "Landscape" else A4
-        page_w_pt, page_h_pt = page_size
-        margin_pt = margin * cm
-        printable_width_cm = (page_w_pt / cm) - (2 * margin)
-        col_widths = self.get_column_widths_cm(printable_width_cm)
-        
-        doc = SimpleDocTemplate(output_path, pagesize=page_size, leftMargin=margin_pt, rightMargin=margin_pt, topMargin=margin_pt, bottomMargin=margin_pt)
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontName=font_bold, alignment=1, spaceAfter=10)
-        elements.append(Paragraph(f"Karşılaştırma Raporu - {datetime.now().strftime('%d.%m.%Y')}", title_style))
-        elements.append(Spacer(1, 0.5 * cm))
-        
-        cell_style = ParagraphStyle('CellStyle', parent=styles['Normal'], fontName=font_regular, fontSize=8, leading=10, alignment=TA_LEFT)
-        header_style = ParagraphStyle('HeaderStyle', parent=styles['Normal'], fontName=font_bold, fontSize=9, textColor=colors.whitesmoke, alignment=TA_CENTER)
-        
-        data = []
-        headers = [Paragraph(col, header_style) for col in self.df.columns]
-        data.append(headers)
-        
-        for row in self.df.values:
-            row_data = []
-            for item in row:
-                text = str(item) if pd.notna(item) else ""
-                row_data.append(Paragraph(text, cell_style))
-            data.append(row_data)
-            
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        tbl_style = TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.aliceblue, colors.whitesmoke]),
-            ('LEFTPADDING', (0,0), (-1,-1), 3), ('RIGHTPADDING', (0,0), (-1,-1), 3),
-            ('TOPPADDING', (0,0), (-1,-1), 3), ('BOTTOMPADDING', (0,0), (-1,-1), 3),
-        ])
-        table.setStyle(tbl_style)
-        elements.append(table)
-        elements.append(Spacer(1, 0.5 * cm))
-        elements.append(Paragraph(f"Toplam Kayıt Sayısı: {len(self.df)}", styles['Normal']))
-        
-        try:
-            doc.build(elements)
-            return True, ""
-        except Exception as e:
-            return False, str(e)
+        weights = {col: var.get() for col, var in self.col_weights.items()}
+        return build_pdf_report(self.df, output_path, weights, self.orientation_var.get(), self.margin_var.get())
 
     def generate_temp_preview(self):
         try:
@@ -270,8 +247,88 @@ class PDFLayoutEditor:
                 self.top.destroy()
             else: messagebox.showerror("Hata", f"Kaydedilemedi: {msg}")
 
+# --- PDF OLUŞTURMA ---
+
+def initial_column_weight(col, stats):
+    return max(len(str(col)), stats["p90_len"], 5)
+
+def build_pdf_report(df, output_path, col_weights, orientation="Landscape", margin=1.0):
+    """
+    Tabloyu PDF raporu olarak yazar. col_weights sütun adı -> genişlik ağırlığı sözlüğüdür.
+    (basari, hata_mesaji) döndürür.
+    """
+    page_size = landscape(A4) if orientation == "Landscape" else A4
+    page_w_pt, page_h_pt = page_size
+    margin_pt = margin * cm
+    printable_width_cm = (page_w_pt / cm) - (2 * margin)
+    total_weight = sum(col_weights.values())
+    if total_weight == 0: total_weight = 1
+    col_widths = [(col_weights[col] / total_weight) * printable_width_cm * cm for col in df.columns]
+    
+    doc = SimpleDocTemplate(output_path, pagesize=page_size, leftMargin=margin_pt, rightMargin=margin_pt, topMargin=margin_pt, bottomMargin=margin_pt)
+    elements = []
+    styles = getSampleStyleSheet()
+    
+    title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontName=font_bold, alignment=1, spaceAfter=10)
+    elements.append(Paragraph(f"Karşılaştırma Raporu - {datetime.now().strftime('%d.%m.%Y')}", title_style))
+    elements.append(Spacer(1, 0.5 * cm))
+    
+    cell_style = ParagraphStyle('CellStyle', parent=styles['Normal'], fontName=font_regular, fontSize=8, leading=10, alignment=TA_LEFT)
+    header_style = ParagraphStyle('HeaderStyle', parent=styles['Normal'], fontName=font_bold, fontSize=9, textColor=colors.whitesmoke, alignment=TA_CENTER)
+    
+    data = []
+    headers = [Paragraph(col, header_style) for col in df.columns]
+    data.append(headers)
+    
+    for row in df.values:
+        row_data = []
+        for item in row:
+            text = str(item) if pd.notna(item) else ""
+            row_data.append(Paragraph(text, cell_style))
+        data.append(row_data)
+        
+    table = Table(data, colWidths=col_widths, repeatRows=1)
+    tbl_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.aliceblue, colors.whitesmoke]),
+        ('LEFTPADDING', (0,0), (-1,-1), 3), ('RIGHTPADDING', (0,0), (-1,-1), 3),
+        ('TOPPADDING', (0,0), (-1,-1), 3), ('BOTTOMPADDING', (0,0), (-1,-1), 3),
+    ])
+    table.setStyle(tbl_style)
+    elements.append(table)
+    elements.append(Spacer(1, 0.5 * cm))
+    elements.append(Paragraph(f"Toplam Kayıt Sayısı: {len(df)}", styles['Normal']))
+    
+    try:
+        doc.build(elements)
+        return True, ""
+    except Exception as e:
+        return False, str(e)
+
 # --- VERİ İŞLEME FONKSİYONLARI ---
 
+def compute_column_stats(df):
+    """
+    Her sütun için tek geçişte istatistik çıkarır: boş olmayan değer var mı,
+    en uzun / %90'lık metin uzunluğu ve farklı değer sayısı.
+    Veri seti değiştiğinde (yapıştırma, ekleme, karşılaştırma) yeniden hesaplanmalıdır.
+    """
+    stats = {}
+    for col in df.columns:
+        text = df[col].astype(str).str.strip()
+        lengths = text.str.len()
+        has_rows = len(lengths) > 0
+        stats[col] = {
+            "non_empty": bool(lengths.gt(0).any()),
+            "max_len": int(lengths.max()) if has_rows else 0,
+            "p90_len": int(lengths.quantile(0.9)) if has_rows else 0,
+            "distinct": int(text.nunique()),
+        }
+    return stats
+
 def parse_clipboard_data(clipboard_text, log_callback):
     """
     Panodaki veriyi okur. Sütun isimleri FIXED_HEADERS'dan alınır.
@@ -370,15 +427,76 @@ def process_comparison(df1, df2, columns_to_use, log_callback):
         log_callback(f"Detay: {traceback.format_exc()}", "DEBUG")
         return None
 
+class ExportCancelled(Exception):
+    """Dosyaya aktarım kullanıcı tarafından iptal edildi."""
+
+def export_dataframe_to_file(df, file_path, columns=None, progress_callback=None, chunk_size=EXPORT_CHUNK_ROWS, cancel_event=None):
+    """
+    Veriyi parça parça dosyaya yazar; tüm tablo tek bir metne dönüştürülmez.
+    Biçim uzantıdan belirlenir: .xlsx (openpyxl salt-yazma modu), .tsv/.txt (sekme), diğerleri
+    noktalı virgülle ayrılmış CSV.
+    progress_callback(yazilan, toplam) her parçadan sonra çağrılır. cancel_event (threading.Event)
+    ayarlanırsa aktarım parça sınırında durur, yarım dosya silinir ve ExportCancelled fırlatılır.
+    """
+    if columns is None:
+        columns = list(df.columns)
+    total = len(df)
+    ext = os.path.splitext(file_path)[1].lower()
+
+    def chunks():
+        for start in range(0, total, chunk_size):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ExportCancelled()
+            stop = min(start + chunk_size, total)
+            yield stop, df.iloc[start:stop][columns]
+
+    if ext == ".xlsx":
+        if Workbook is None:
+            raise RuntimeError("XLSX aktarımı için 'openpyxl' paketi gerekli.")
+        if total + 1 > XLSX_MAX_ROWS:
+            raise RuntimeError(f"Sonuç {total} satır; Excel sayfası en fazla {XLSX_MAX_ROWS - 1} veri satırı alabilir. Lütfen CSV olarak aktarın.")
+
+        def xlsx_value(item):
+            if pd.isna(item): return ""
+            # Kontrol karakterleri openpyxl'de IllegalCharacterError'a yol açar
+            if isinstance(item, str): return ILLEGAL_CHARACTERS_RE.sub("", item)
+            return item
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sonuç")
+        ws.append([xlsx_value(str(col)) for col in columns])
+        for written, chunk in chunks():
+            for row in chunk.itertuples(index=False, name=None):
+                ws.append([xlsx_value(item) for item in row])
+            if progress_callback: progress_callback(written, total)
+        wb.save(file_path)
+    else:
+        # ';' bilinçli seçimdir: Türkçe bölge ayarlı Excel CSV'de liste ayırıcı olarak ';' bekler
+        # (virgül ondalık ayırıcıdır). Betiklerle okunacak çıktılar için .tsv kullanılabilir.
+        sep = '\t' if ext in (".tsv", ".txt") else ';'
+        # utf-8-sig: Excel'in Türkçe karakterleri doğru açması için BOM eklenir
+        try:
+            with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+                f.write(sep.join(str(col) for col in columns) + "\n")
+                for written, chunk in chunks():
+                    chunk.to_csv(f, sep=sep, index=False, header=False, lineterminator="\n")
+                    if progress_callback: progress_callback(written, total)
+        except ExportCancelled:
+            os.remove(file_path)
+            raise
+    if total == 0 and progress_callback:
+        progress_callback(0, 0)
+
 # --- SÜTUN SEÇİCİ PENCERESİ ---
 
 class ColumnSelectorDialog:
-    def __init__(self, parent, all_columns, currently_selected, callback):
+    def __init__(self, parent, all_columns, currently_selected, callback, column_stats=None):
         self.top = tk.Toplevel(parent)
         self.top.title("Görünümü Özelleştir (Analist Modu)")
         self.top.geometry("500x600")
         self.callback = callback
         self.all_columns = all_columns
+        self.column_stats = column_stats
         self.vars = {}
         
         for col in all_columns:
@@ -425,7 +543,11 @@ class ColumnSelectorDialog:
         filter_text = filter_text.lower()
         for col in self.all_columns:
             if filter_text and filter_text not in col.lower(): continue
-            cb = ttk.Checkbutton(self.scrollable_frame, text=col, variable=self.vars[col])
+            text = col
+            if self.column_stats is not None:
+                stats = self.column_stats[col]
+                text = f"{col}  ({stats['distinct']} farklı değer, en uzun {stats['max_len']} karakter)"
+            cb = ttk.Checkbutton(self.scrollable_frame, text=text, variable=self.vars[col])
             cb.pack(anchor='w', pady=2)
 
     def filter_list(self, *args): self.create_checkbuttons(self.search_var.get())
@@ -508,6 +630,7 @@ class PasteComparisonApp:
         self.btn_pdf = ttk.Button(control_frame, text="📄 PDF Önizle ve Kaydet", command=self.open_pdf_editor, state=tk.DISABLED)
         self.btn_pdf.pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="📋 Excel/Kopyala", command=self.copy_result_to_clipboard).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="💾 Dosyaya Aktar", command=self.export_result_to_file).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="🗑️ Tümünü Temizle", command=self.clear_all).pack(side=tk.LEFT, padx=5)
         ttk.Separator(control_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=10)
         ttk.Checkbutton(control_frame, text="Boş Sütunları Gizle", variable=self.hide_empty_cols_var, command=self.refresh_all_views).pack(side=tk.LEFT, padx=5)
@@ -533,7 +656,11 @@ class PasteComparisonApp:
         self.display_df = None
         self.df1 = None
         self.df2 = None
+        self.df1_stats = None
+        self.df2_stats = None
+        self.result_stats = None
         self.current_selected_columns = None 
+        self.export_cancel_event = None
         self.root.bind('<Control-v>', self.handle_paste_shortcut)
 
     def create_treeview(self, parent):
@@ -585,7 +712,8 @@ class PasteComparisonApp:
                 else:
                     self.log_status(f"1. alana veri yapıştırıldı ({len(new_df)} satır).", "INFO")
                     self.df1 = new_df
-                self.populate_tree(self.tree1, self.df1)
+                self.df1_stats = compute_column_stats(self.df1)
+                self.populate_tree(self.tree1, self.df1, self.df1_stats)
                 self.count_label1.config(text=f"Satır: {len(self.df1)}")
             else:
                 if self.df2 is not None and not self.df2.empty:
@@ -594,20 +722,20 @@ class PasteComparisonApp:
                 else:
                     self.log_status(f"2. alana veri yapıştırıldı ({len(new_df)} satır).", "INFO")
                     self.df2 = new_df
-                self.populate_tree(self.tree2, self.df2)
+                self.df2_stats = compute_column_stats(self.df2)
+                self.populate_tree(self.tree2, self.df2, self.df2_stats)
                 self.count_label2.config(text=f"Satır: {len(self.df2)}")
         except Exception as e:
             messagebox.showerror("Hata", f"Yapıştırma hatası: {e}")
             print(traceback.format_exc())
 
-    def populate_tree(self, tree, df):
+    def populate_tree(self, tree, df, stats):
         tree.delete(*tree.get_children())
         if df is None or df.empty: return
-        display_df_local = df.copy()
+        display_df_local = df
         
         if self.hide_empty_cols_var.get():
-            def is_col_not_empty(series): return series.astype(str).str.strip().ne('').any()
-            non_empty_cols = [col for col in display_df_local.columns if is_col_not_empty(display_df_local[col])]
+            non_empty_cols = [col for col in display_df_local.columns if stats[col]["non_empty"]]
             if non_empty_cols: display_df_local = display_df_local[non_empty_cols]
 
         columns = list(display_df_local.columns)
@@ -615,28 +743,31 @@ class PasteComparisonApp:
         tree.column('#0', width=0, stretch=tk.NO)
         for col in columns:
             tree.heading(col, text=col, anchor=tk.W)
-            width = min(max(100, len(str(col)) * 10), 300)
+            text_len = max(len(str(col)), stats[col]["p90_len"])
+            width = min(max(100, text_len * 10), 300)
             tree.column(col, width=width, anchor=tk.W)
         for _, row in display_df_local.iterrows():
             values = [str(val) for val in row]
             tree.insert('', tk.END, values=values)
 
     def refresh_all_views(self):
-        if self.df1 is not None: self.populate_tree(self.tree1, self.df1)
-        if self.df2 is not None: self.populate_tree(self.tree2, self.df2)
-        if self.display_df is not None: self.populate_tree(self.result_tree, self.display_df)
-        elif self.result_df is not None: self.populate_tree(self.result_tree, self.result_df)
+        if self.df1 is not None: self.populate_tree(self.tree1, self.df1, self.df1_stats)
+        if self.df2 is not None: self.populate_tree(self.tree2, self.df2, self.df2_stats)
+        if self.display_df is not None: self.populate_tree(self.result_tree, self.display_df, self.result_stats)
+        elif self.result_df is not None: self.populate_tree(self.result_tree, self.result_df, self.result_stats)
 
     def clear_tree(self, tree_num):
         if tree_num == 1:
             self.tree1.delete(*self.tree1.get_children())
             self.tree1['columns'] = []
             self.df1 = None
+            self.df1_stats = None
             self.count_label1.config(text="Satır: 0")
         else:
             self.tree2.delete(*self.tree2.get_children())
             self.tree2['columns'] = []
             self.df2 = None
+            self.df2_stats = None
             self.count_label2.config(text="Satır: 0")
 
     def clear_all(self):
@@ -645,6 +776,7 @@ class PasteComparisonApp:
         self.result_tree.delete(*self.result_tree.get_children())
         self.result_df = None
         self.display_df = None
+        self.result_stats = None
         self.current_selected_columns = None
         self.stats_label.config(text="Temizlendi.")
         self.btn_customize.config(state=tk.DISABLED)
@@ -658,8 +790,9 @@ class PasteComparisonApp:
         if result is not None and not result.empty:
             self.result_df = result
             self.display_df = result
+            self.result_stats = compute_column_stats(result)
             self.current_selected_columns = list(result.columns)
-            self.populate_tree(self.result_tree, result)
+            self.populate_tree(self.result_tree, result, self.result_stats)
             msg = f"Toplam {len(result)} ortak kayıt bulundu."
             self.stats_label.config(text=msg, foreground='green', font=('Arial', 9, 'bold'))
             self.btn_customize.config(state=tk.NORMAL)
@@ -668,6 +801,7 @@ class PasteComparisonApp:
         else:
             self.result_df = None
             self.display_df = None
+            self.result_stats = None
             self.result_tree.delete(*self.result_tree.get_children())
             self.stats_label.config(text="Ortak kayıt bulunamadı.", foreground='red')
             self.btn_customize.config(state=tk.DISABLED)
@@ -679,17 +813,15 @@ class PasteComparisonApp:
         all_columns = list(self.result_df.columns)
         initial_selection = self.current_selected_columns if self.current_selected_columns is not None else all_columns
         if self.hide_empty_cols_var.get():
-            def is_col_not_empty(series): return series.astype(str).str.strip().ne('').any()
-            non_empty_cols = [col for col in all_columns if is_col_not_empty(self.result_df[col])]
-            initial_selection = [col for col in initial_selection if col in non_empty_cols]
-        ColumnSelectorDialog(self.root, all_columns, initial_selection, self.apply_custom_view)
+            initial_selection = [col for col in initial_selection if self.result_stats[col]["non_empty"]]
+        ColumnSelectorDialog(self.root, all_columns, initial_selection, self.apply_custom_view, self.result_stats)
 
     def apply_custom_view(self, selected_columns):
         if self.result_df is None: return
         try:
             self.current_selected_columns = selected_columns
             self.display_df = self.result_df[selected_columns].copy()
-            self.populate_tree(self.result_tree, self.display_df)
+            self.populate_tree(self.result_tree, self.display_df, self.result_stats)
             self.log_status(f"Görünüm özelleştirildi: {len(selected_columns)} sütun gösteriliyor.", "INFO")
         except Exception as e:
             self.log_status(f"Görünüm güncellenirken hata: {e}", "ERROR")
@@ -697,6 +829,10 @@ class PasteComparisonApp:
     def copy_result_to_clipboard(self):
         df_to_copy = self.display_df if self.display_df is not None else self.result_df
         if df_to_copy is not None:
+            if len(df_to_copy) > CLIPBOARD_MAX_ROWS:
+                if messagebox.askyesno("Büyük Sonuç", f"Sonuç {len(df_to_copy)} satır; panoya kopyalamak uygulamayı dondurabilir.\nBunun yerine dosyaya aktarılsın mı?"):
+                    self.export_result_to_file()
+                return
             self.root.clipboard_clear()
             self.root.clipboard_append(df_to_copy.to_csv(sep='\t', index=False))
             self.root.update()
@@ -704,16 +840,479 @@ class PasteComparisonApp:
         else:
             messagebox.showwarning("Uyarı", "Kopyalanacak sonuç yok.")
 
+    def export_result_to_file(self):
+        if self.result_df is None or self.result_df.empty:
+            messagebox.showwarning("Uyarı", "Aktarılacak sonuç yok.")
+            return
+        filetypes = [("CSV Dosyası", "*.csv"), ("Sekmeli Metin", "*.tsv")]
+        if Workbook is not None:
+            filetypes.insert(0, ("Excel Dosyası", "*.xlsx"))
+        default_ext = filetypes[0][1][1:]
+        file_path = filedialog.asksaveasfilename(defaultextension=default_ext, initialfile=f"Sonuc_{datetime.now().strftime('%Y%m%d')}{default_ext}", filetypes=filetypes, title="Sonucu Dosyaya Aktar")
+        if not file_path: return
+        if self.export_cancel_event is not None:
+            messagebox.showwarning("Uyarı", "Devam eden bir aktarım var.")
+            return
+        df = self.result_df
+        columns = self.current_selected_columns if self.current_selected_columns is not None else list(df.columns)
+
+        # Yazma işlemi arka planda yürür; Tk yalnızca ana iş parçacığından güncellenir,
+        # bu yüzden ilerleme bir kuyruk üzerinden aktarılır ve after() ile okunur.
+        events = queue.Queue()
+        cancel_event = threading.Event()
+        self.export_cancel_event = cancel_event
+
+        progress_win = tk.Toplevel(self.root)
+        progress_win.title("Dosyaya Aktarılıyor")
+        progress_win.resizable(False, False)
+        progress_win.transient(self.root)
+        progress_label = ttk.Label(progress_win, text=f"0/{len(df)} satır")
+        progress_label.pack(padx=20, pady=(15, 5))
+        progress_bar = ttk.Progressbar(progress_win, length=300, maximum=100)
+        progress_bar.pack(padx=20, pady=5)
+        cancel_button = ttk.Button(progress_win, text="İptal", command=cancel_event.set)
+        cancel_button.pack(pady=(5, 15))
+        progress_win.protocol("WM_DELETE_WINDOW", cancel_event.set)
+
+        def worker():
+            try:
+                export_dataframe_to_file(df, file_path, columns, lambda written, total: events.put(("progress", written, total)), cancel_event=cancel_event)
+                events.put(("done",))
+            except ExportCancelled:
+                events.put(("cancelled",))
+            except Exception as e:
+                events.put(("error", str(e)))
+
+        def poll():
+            finished = None
+            while True:
+                try: event = events.get_nowait()
+                except queue.Empty: break
+                if event[0] == "progress":
+                    written, total = event[1], event[2]
+                    percent = int(written * 100 / total) if total else 100
+                    progress_bar['value'] = percent
+                    progress_label.config(text=f"{written}/{total} satır (%{percent})")
+                    self.stats_label.config(text=f"Dosyaya aktarılıyor... {written}/{total} satır (%{percent})", foreground='blue')
+                else:
+                    finished = event
+            if finished is None:
+                if cancel_event.is_set(): cancel_button.config(state=tk.DISABLED, text="İptal ediliyor...")
+                self.root.after(100, poll)
+                return
+            self.export_cancel_event = None
+            progress_win.destroy()
+            if finished[0] == "done":
+                self.stats_label.config(text=f"{len(df)} satır dosyaya aktarıldı.", foreground='green')
+                self.log_status(f"Dosyaya aktarım tamamlandı ({len(df)} satır).", "SUCCESS")
+                messagebox.showinfo("Başarılı", "Sonuçlar dosyaya kaydedildi.")
+            elif finished[0] == "cancelled":
+                self.stats_label.config(text="Dosyaya aktarım iptal edildi.", foreground='gray')
+                self.log_status("Dosyaya aktarım iptal edildi.", "WARN")
+            else:
+                self.stats_label.config(text="Dosyaya aktarım başarısız.", foreground='red')
+                self.log_status(f"Dosyaya aktarım hatası: {finished[1]}", "ERROR")
+                messagebox.showerror("Hata", f"Kaydedilemedi: {finished[1]}")
+
+        self.log_status(f"Sonuç dosyaya aktarılıyor: {file_path}", "INFO")
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(100, poll)
+
     def open_pdf_editor(self):
         df_to_export = self.display_df if self.display_df is not None else self.result_df
         if df_to_export is None or df_to_export.empty:
             messagebox.showwarning("Uyarı", "PDF'e aktarılacak veri yok.")
             return
-        PDFLayoutEditor(self.root, df_to_export, None)
+        PDFLayoutEditor(self.root, df_to_export, None, self.result_stats)
+
+# --- YEREL SERVİS MODU (JSON API) ---
+
+def build_key_index(df, columns=BASE_COLUMNS):
+    """Karşılaştırma anahtarlarını (boşlukları temizlenmiş) MultiIndex olarak hazırlar."""
+    if any(col not in df.columns for col in columns):
+        return None
+    return pd.MultiIndex.from_frame(df[columns].astype(str).apply(lambda x: x.str.strip()))
+
+class DatasetStore:
+    """
+    Servis modunda yüklenen veri setlerini, istatistiklerini ve anahtar indekslerini bellekte tutar.
+    Bellek sınırı aşılınca veya veri seti uzun süre kullanılmayınca en eski kayıtlar atılır.
+    """
+    def __init__(self, memory_cap_bytes, idle_seconds=SERVICE_IDLE_SECONDS):
+        self.memory_cap_bytes = memory_cap_bytes
+        self.idle_seconds = idle_seconds
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _make_entry(self, df, name):
+        keys = build_key_index(df)
+        nbytes = int(df.memory_usage(deep=True).sum())
+        if keys is not None:
+            nbytes += int(keys.memory_usage(deep=True))
+        return {"df": df, "stats": compute_column_stats(df), "keys": keys, "name": name, "nbytes": nbytes, "last_used": time.monotonic()}
+
+    def put(self, df, name=None, dataset_id=None):
+        """Yeni veri seti ekler; dataset_id verilirse o kimlikteki kayıt yerine yazılır."""
+        entry = self._make_entry(df, name)
+        if dataset_id is None:
+            dataset_id = uuid.uuid4().hex[:12]
+        with self.lock:
+            self.entries[dataset_id] = entry
+            self.entries.move_to_end(dataset_id)
+            self._evict(keep_id=dataset_id)
+        return dataset_id, entry
+
+    def append(self, dataset_id, new_df):
+        # Ekleme yeni bir veri sürümü oluşturur; istatistik ve indeks yeniden hesaplanır.
+        # Hesaplama kilit dışında yapılır; bu arada başka bir ekleme kaydı değiştirdiyse
+        # güncel sürüm üzerinden yeniden denenir, böylece eş zamanlı eklemeler kaybolmaz.
+        while True:
+            with self.lock:
+                old = self.entries.get(dataset_id)
+            if old is None:
+                return None
+            entry = self._make_entry(pd.concat([old["df"], new_df], ignore_index=True), old["name"])
+            with self.lock:
+                current = self.entries.get(dataset_id)
+                if current is None:
+                    return None
+                if current is not old:
+                    continue
+                self.entries[dataset_id] = entry
+                self.entries.move_to_end(dataset_id)
+                self._evict(keep_id=dataset_id)
+            return entry
+
+    def get(self, dataset_id):
+        with self.lock:
+            self._evict()
+            entry = self.entries.get(dataset_id)
+            if entry is not None:
+                entry["last_used"] = time.monotonic()
+                self.entries.move_to_end(dataset_id)
+            return entry
+
+    def remove(self, dataset_id):
+        with self.lock:
+            return self.entries.pop(dataset_id, None) is not None
+
+    def describe(self):
+        with self.lock:
+            self._evict()
+            return [{"dataset_id": dataset_id, "name": e["name"], "rows": len(e["df"]), "bytes": e["nbytes"]} for dataset_id, e in self.entries.items()]
+
+    def sweep(self):
+        """Boşta kalan veri setlerini atar; servis sessizken de belleğin boşalması için periyodik çağrılır."""
+        with self.lock:
+            self._evict()
+
+    def _evict(self, keep_id=None):
+        now = time.monotonic()
+        for dataset_id in [d for d, e in self.entries.items() if d != keep_id and now - e["last_used"] > self.idle_seconds]:
+            del self.entries[dataset_id]
+        total = sum(e["nbytes"] for e in self.entries.values())
+        for dataset_id in list(self.entries):
+            if total <= self.memory_cap_bytes: break
+            if dataset_id == keep_id: continue
+            total -= self.entries.pop(dataset_id)["nbytes"]
+
+class ServiceRequestError(Exception):
+    """İstemci kaynaklı geçersiz istek; servis 400 ile yanıtlar."""
+
+def require_str(payload, key, default=None):
+    value = payload.get(key, default)
+    if not isinstance(value, str) or not value:
+        raise ServiceRequestError(f"'{key}' boş olmayan bir metin olmalı.")
+    return value
+
+def require_bool(payload, key, default):
+    value = payload.get(key, default)
+    if not isinstance(value, bool):
+        raise ServiceRequestError(f"'{key}' true/false olmalı.")
+    return value
+
+def compare_datasets(entry1, entry2, log_callback):
+    """
+    Önceden hazırlanmış anahtar indeksleriyle yalnızca ortak anahtarlı satırları ayıklayıp
+    process_comparison'a verir; sonuç tüm satırlarla yapılan karşılaştırmayla aynıdır.
+    """
+    df1, df2 = entry1["df"], entry2["df"]
+    if entry1["keys"] is not None and entry2["keys"] is not None:
+        df1 = df1[entry1["keys"].isin(entry2["keys"])]
+        df2 = df2[entry2["keys"].isin(entry1["keys"])]
+    return process_comparison(df1.copy(), df2.copy(), BASE_COLUMNS, log_callback)
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    Tüm istekler servis anahtarını X-Servis-Token başlığında taşımalı,
+    Host başlığı 127.0.0.1:<port> veya localhost:<port> olmalı ve Origin başlığı bulunmamalıdır (tarayıcı kaynaklı
+    istekler reddedilir). POST gövdeleri application/json olmalıdır. Dışa aktarım yolları
+    çıktı klasörüne göre çözülür; klasörün dışına yazılamaz.
+
+    JSON API:
+      GET    /health
+      GET    /datasets
+      POST   /datasets                {"text": "<sekmeli veri>", "name": "..."}
+      POST   /datasets/<id>/append    {"text": "<sekmeli veri>"}
+      DELETE /datasets/<id>
+      POST   /compare                 {"left": id, "right": id, "include_rows": true, "store_result": false}
+      POST   /export                  {"dataset_id": id, "path": "...pdf|xlsx|csv|tsv", "columns": [...],
+                                       "orientation": "Landscape|Portrait", "margin_cm": 1.0}
+    """
+    server_version = "KarsilastirmaServis/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def authorize(self):
+        """İstek yetkiliyse True döner; değilse hata yanıtını gönderip False döner."""
+        if self.headers.get("Origin") is not None:
+            self.send_json(403, {"error": "Tarayıcı kaynaklı isteklere izin verilmez."})
+            return False
+        if self.headers.get("Host") not in self.server.allowed_hosts:
+            self.send_json(403, {"error": "Geçersiz Host başlığı."})
+            return False
+        token = self.headers.get(SERVICE_TOKEN_HEADER) or ""
+        if not hmac.compare_digest(token.encode("utf-8"), self.server.token.encode("utf-8")):
+            self.send_json(401, {"error": "Geçersiz veya eksik servis anahtarı."})
+            return False
+        return True
+
+    def read_json(self):
+        content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+        if content_type != "application/json":
+            raise ValueError("Content-Type 'application/json' olmalı.")
+        length = int(self.headers.get("Content-Length") or 0)
+        if length == 0:
+            return {}
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        if not isinstance(payload, dict):
+            raise ValueError("İstek gövdesi bir JSON nesnesi olmalı.")
+        return payload
+
+    def path_parts(self):
+        return [part for part in self.path.split("?", 1)[0].split("/") if part]
+
+    def do_GET(self):
+        if not self.authorize(): return
+        parts = self.path_parts()
+        if parts == ["health"]:
+            self.send_json(200, {"status": "ok"})
+        elif parts == ["datasets"]:
+            self.send_json(200, {"datasets": self.server.store.describe()})
+        else:
+            self.send_json(404, {"error": "Bilinmeyen adres."})
+
+    def do_DELETE(self):
+        if not self.authorize(): return
+        parts = self.path_parts()
+        if len(parts) == 2 and parts[0] == "datasets":
+            if self.server.store.remove(parts[1]):
+                self.send_json(200, {"deleted": parts[1]})
+            else:
+                self.send_json(404, {"error": "Veri seti bulunamadı."})
+        else:
+            self.send_json(404, {"error": "Bilinmeyen adres."})
+
+    def do_POST(self):
+        if not self.authorize(): return
+        try:
+            payload = self.read_json()
+        except ValueError as e:
+            self.send_json(400, {"error": f"Geçersiz istek: {e}"})
+            return
+        logs = []
+        def log_callback(message, level="INFO"): logs.append({"level": level, "message": message})
+
+        parts = self.path_parts()
+        try:
+            if parts == ["datasets"]:
+                self.handle_load(payload, log_callback, logs)
+            elif len(parts) == 3 and parts[0] == "datasets" and parts[2] == "append":
+                self.handle_append(parts[1], payload, log_callback, logs)
+            elif parts == ["compare"]:
+                self.handle_compare(payload, log_callback, logs)
+            elif parts == ["export"]:
+                self.handle_export(payload, logs)
+            else:
+                self.send_json(404, {"error": "Bilinmeyen adres."})
+        except ServiceRequestError as e:
+            self.send_json(400, {"error": str(e), "log": logs})
+        except Exception as e:
+            log_callback(f"Detay: {traceback.format_exc()}", "DEBUG")
+            self.send_json(500, {"error": str(e), "log": logs})
+
+    def handle_load(self, payload, log_callback, logs):
+        text = require_str(payload, "text")
+        name = payload.get("name")
+        if name is not None and not isinstance(name, str):
+            raise ServiceRequestError("'name' bir metin olmalı.")
+        df = parse_clipboard_data(text, log_callback)
+        if df is None:
+            self.send_json(400, {"error": "Veri işlenemedi.", "log": logs})
+            return
+        dataset_id, entry = self.server.store.put(df, name)
+        self.send_json(200, {"dataset_id": dataset_id, "rows": len(entry["df"]), "log": logs})
+
+    def handle_append(self, dataset_id, payload, log_callback, logs):
+        new_df = parse_clipboard_data(require_str(payload, "text"), log_callback)
+        if new_df is None:
+            self.send_json(400, {"error": "Veri işlenemedi.", "log": logs})
+            return
+        entry = self.server.store.append(dataset_id, new_df)
+        if entry is None:
+            self.send_json(404, {"error": "Veri seti bulunamadı."})
+            return
+        self.send_json(200, {"dataset_id": dataset_id, "rows": len(entry["df"]), "log": logs})
+
+    def handle_compare(self, payload, log_callback, logs):
+        left = require_str(payload, "left")
+        right = require_str(payload, "right")
+        store_result = require_bool(payload, "store_result", False)
+        include_rows = require_bool(payload, "include_rows", True)
+        entry1 = self.server.store.get(left)
+        entry2 = self.server.store.get(right)
+        if entry1 is None or entry2 is None:
+            self.send_json(404, {"error": "Veri seti bulunamadı."})
+            return
+        result = compare_datasets(entry1, entry2, log_callback)
+        if result is None:
+            self.send_json(400, {"error": "Karşılaştırma yapılamadı.", "log": logs})
+            return
+        response = {"dataset_id": None, "rows": len(result), "columns": list(result.columns), "log": logs}
+        if store_result and not result.empty:
+            # Aynı çift için tek sonuç kaydı tutulur; tekrarlanan karşılaştırmalar onu günceller
+            # Kimlik (sol, sağ) çiftinin özetinden türetilir; sonuçlar da karşılaştırılabildiğinden
+            # düz birleştirme ("a" + "b-c" ile "a-b" + "c") çakışabilirdi
+            pair_digest = hashlib.sha256(json.dumps([left, right]).encode("utf-8")).hexdigest()[:16]
+            result_id = f"sonuc_{pair_digest}"
+            response["dataset_id"], _ = self.server.store.put(result, "Karşılaştırma Sonucu", result_id)
+        if include_rows:
+            response["data"] = result.to_dict(orient="records")
+        self.send_json(200, response)
+
+    def handle_export(self, payload, logs):
+        dataset_id = require_str(payload, "dataset_id")
+        columns = payload.get("columns")
+        if columns is not None and not (isinstance(columns, list) and columns and all(isinstance(col, str) for col in columns)):
+            raise ServiceRequestError("'columns' sütun adlarından oluşan boş olmayan bir liste olmalı.")
+        orientation = payload.get("orientation", "Landscape")
+        if orientation not in ("Landscape", "Portrait"):
+            raise ServiceRequestError("'orientation' 'Landscape' veya 'Portrait' olmalı.")
+        margin = payload.get("margin_cm", 1.0)
+        # Düzenleyicideki kenar boşluğu ölçeği ile aynı aralık
+        if isinstance(margin, bool) or not isinstance(margin, (int, float)) or not 0.5 <= margin <= 3.0:
+            raise ServiceRequestError("'margin_cm' 0.5 ile 3.0 arasında bir sayı olmalı.")
+
+        entry = self.server.store.get(dataset_id)
+        if entry is None:
+            self.send_json(404, {"error": "Veri seti bulunamadı."})
+            return
+        df = entry["df"]
+        if columns is None:
+            columns = list(df.columns)
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ServiceRequestError(f"Bilinmeyen sütunlar: {', '.join(missing)}")
+        output_path = self.resolve_output_path(payload.get("path"))
+        if output_path is None:
+            raise ServiceRequestError(f"'path' çıktı klasörü içinde, {', '.join(SERVICE_EXPORT_EXTENSIONS)} uzantılı bir dosya olmalı.")
+        if output_path.lower().endswith(".xlsx"):
+            # export_dataframe_to_file da denetler; burada önceden bakılarak istemci hatası 400 olarak döner
+            if Workbook is None:
+                raise ServiceRequestError("XLSX aktarımı için sunucuda 'openpyxl' paketi kurulu değil; CSV veya TSV kullanın.")
+            if len(df) + 1 > XLSX_MAX_ROWS:
+                raise ServiceRequestError(f"Veri seti {len(df)} satır; Excel sayfası en fazla {XLSX_MAX_ROWS - 1} veri satırı alabilir. CSV veya TSV kullanın.")
+
+        # Tüm denetimler geçtikten sonra klasör oluşturulur; reddedilen istekler diske dokunmaz
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if output_path.lower().endswith(".pdf"):
+            weights = {col: initial_column_weight(col, entry["stats"][col]) for col in columns}
+            success, msg = build_pdf_report(df[columns], output_path, weights, orientation, float(margin))
+            if not success:
+                self.send_json(500, {"error": f"PDF oluşturulamadı: {msg}", "log": logs})
+                return
+        else:
+            export_dataframe_to_file(df, output_path, columns)
+        self.send_json(200, {"path": output_path, "rows": len(df), "log": logs})
+
+    def resolve_output_path(self, requested):
+        """İstenen yolu çıktı klasörüne göre çözer; klasör dışındaysa veya uzantı uygun değilse None döner."""
+        if not isinstance(requested, str) or not requested:
+            return None
+        output_dir = self.server.output_dir
+        resolved = os.path.realpath(os.path.join(output_dir, requested))
+        try:
+            if os.path.commonpath([resolved, output_dir]) != output_dir: return None
+        except ValueError:
+            # Windows'ta farklı sürücüdeki yollar
+            return None
+        if resolved == output_dir or not resolved.lower().endswith(SERVICE_EXPORT_EXTENSIONS):
+            return None
+        return resolved
+
+def write_token_file(path, token):
+    """Anahtarı yalnızca sahibinin okuyabileceği (0600) bir dosyaya yazar."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token + "\n")
+    os.chmod(path, 0o600)
+
+def run_service(port=SERVICE_DEFAULT_PORT, memory_cap_mb=SERVICE_MEMORY_CAP_MB, output_dir=SERVICE_OUTPUT_DIR, token_file=None):
+    """
+    Servisi başlatır. Anahtar KARSILASTIRMA_SERVIS_ANAHTARI ortam değişkeninden alınır; yoksa her
+    çalıştırmada üretilir. Her iki durumda da betiklerin okuyabilmesi için token_file'a
+    (varsayılan: çıktı klasöründe .servis_anahtari) yazılır.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), ServiceRequestHandler)
+    server.daemon_threads = True
+    server.store = DatasetStore(memory_cap_mb * 1024 * 1024)
+    # Yalnızca yerel adlar kabul edilir; DNS rebinding ile gelen başka Host değerleri reddedilir
+    server.allowed_hosts = (f"127.0.0.1:{port}", f"localhost:{port}")
+    server.token = os.environ.get(SERVICE_TOKEN_ENV) or secrets.token_urlsafe(32)
+    server.output_dir = os.path.realpath(output_dir)
+    os.makedirs(server.output_dir, exist_ok=True)
+    token_file = token_file or os.path.join(server.output_dir, SERVICE_TOKEN_FILE)
+    write_token_file(token_file, server.token)
+    stop_sweeper = threading.Event()
+    def sweeper():
+        while not stop_sweeper.wait(SERVICE_SWEEP_SECONDS):
+            server.store.sweep()
+    threading.Thread(target=sweeper, daemon=True).start()
+
+    print(f"Servis çalışıyor: http://127.0.0.1:{port} (bellek sınırı {memory_cap_mb} MB)")
+    print(f"Çıktı klasörü: {server.output_dir}")
+    print(f"Servis anahtarı ({SERVICE_TOKEN_HEADER} başlığı) dosyaya yazıldı: {os.path.abspath(token_file)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_sweeper.set()
+        server.server_close()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Excel Veri Karşılaştırma ve PDF Aracı")
+    parser.add_argument("--servis", action="store_true", help="Arayüz yerine yerel JSON servisini başlat")
+    parser.add_argument("--port", type=int, default=SERVICE_DEFAULT_PORT, help="Servis portu (yalnızca 127.0.0.1)")
+    parser.add_argument("--bellek-mb", type=int, default=SERVICE_MEMORY_CAP_MB, help="Bellekte tutulacak veri setleri için üst sınır (MB)")
+    parser.add_argument("--cikti-klasoru", default=SERVICE_OUTPUT_DIR, help="Servisin dosya yazabileceği tek klasör")
+    parser.add_argument("--anahtar-dosyasi", default=None, help=f"Servis anahtarının yazılacağı dosya (varsayılan: çıktı klasöründe {SERVICE_TOKEN_FILE}); anahtar {SERVICE_TOKEN_ENV} ile de verilebilir")
+    args = parser.parse_args()
+
     if not os.path.exists("DejaVuSans.ttf"):
         print("UYARI: 'DejaVuSans.ttf' dosyası bulunamadı. Türkçe karakterler PDF'te görünmeyebilir.")
-    root = tk.Tk()
-    app = PasteComparisonApp(root)
-    root.mainloop()
\ No newline at end of file
+    if args.servis:
+        run_service(args.port, args.bellek_mb, args.cikti_klasoru, args.anahtar_dosyasi)
+    else:
+        root = tk.Tk()
+        app = PasteComparisonApp(root)
+        root.mainloop()
\ No newline at end of file